@@ -3,7 +3,9 @@ FastAPI application for the scheduling system.
 Step 1 API: health, state CRUD, backups, restore.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .schemas import (
@@ -35,10 +37,14 @@ async def health_check():
     return {"status": "ok", "message": "API is running"}
 
 
-@app.get("/api/state", response_model=AppState)
+@app.get("/api/state", response_class=Response, responses={200: {"model": AppState}})
 async def get_state():
-    """Get the full application state."""
-    return state_manager.load_state()
+    """
+    Get the full application state.
+    Returns the pre-serialized state JSON, skipping response model validation.
+    """
+    content = await asyncio.to_thread(state_manager.cached_json)
+    return Response(content=content, media_type="application/json")
 
 
 @app.put("/api/state", response_model=SaveResponse)
@@ -48,14 +54,16 @@ async def save_state(state: AppState):
     Creates a backup snapshot automatically.
     Implements "Last write wins" - simply overwrites existing state.
     """
-    saved_at_iso, backup_id = state_manager.save_state(state, create_backup=True)
+    saved_at_iso, backup_id = await asyncio.to_thread(
+        state_manager.save_state, state, create_backup=True
+    )
     return SaveResponse(saved_at_iso=saved_at_iso, backup_id=backup_id or "")
 
 
 @app.get("/api/state/backups", response_model=BackupListResponse)
 async def get_backups():
     """Get list of all backup snapshots."""
-    backups = state_manager.get_backups()
+    backups = await asyncio.to_thread(state_manager.get_backups)
     return BackupListResponse(backups=backups)
 
 
@@ -66,7 +74,7 @@ async def restore_backup(backup_id: str):
     Creates a safety backup of current state before restoring.
     """
     try:
-        restored_at_iso, _ = state_manager.restore_backup(backup_id)
+        restored_at_iso, _ = await asyncio.to_thread(state_manager.restore_backup, backup_id)
         return RestoreResponse(restored_at_iso=restored_at_iso, backup_id=backup_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -5,8 +5,8 @@ Based on the normalized schema from the specification.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Literal, Optional, Union
+from pydantic import BaseModel, Field, model_validator
 
 
 SCHEMA_VERSION = 1
@@ -77,16 +77,22 @@ class TaskStatus(BaseModel):
 
 
 class TaskScheduleRange(BaseModel):
-    mode: ScheduleMode = ScheduleMode.RANGE
+    mode: Literal[ScheduleMode.RANGE] = ScheduleMode.RANGE
     start_iso: str
     end_iso: str
 
 
 class TaskSchedulePoint(BaseModel):
-    mode: ScheduleMode = ScheduleMode.POINT
+    mode: Literal[ScheduleMode.POINT] = ScheduleMode.POINT
     point_iso: str
 
 
+TaskSchedule = Annotated[
+    Union[TaskScheduleRange, TaskSchedulePoint],
+    Field(discriminator="mode"),
+]
+
+
 class Task(BaseModel):
     id: str
     project_id: str
@@ -97,17 +103,30 @@ class Task(BaseModel):
     priority: int = 1
     tags: list[str] = Field(default_factory=list)
     color: str = "auto"
-    schedule: TaskScheduleRange | TaskSchedulePoint
+    schedule: TaskSchedule
     people: list[str] = Field(default_factory=list)
     notes: str = ""
     child_task_ids: list[str] = Field(default_factory=list)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_schedule_mode(cls, data: Any) -> Any:
+        """Infer a missing schedule mode from the variant's fields."""
+        if isinstance(data, dict):
+            schedule = data.get("schedule")
+            if isinstance(schedule, dict) and schedule.get("mode") is None:
+                mode = ScheduleMode.POINT if "point_iso" in schedule else ScheduleMode.RANGE
+                data = {**data, "schedule": {**schedule, "mode": mode.value}}
+        return data
+
 
 class BackupInfo(BaseModel):
     id: str
     created_at_iso: str
     reason: str = "manual_save"
     file_path: str
+    compressed: bool = False
+    base_backup_id: Optional[str] = None
 
 
 class AppState(BaseModel):
@@ -116,7 +135,6 @@ class AppState(BaseModel):
     ui_state: UIState = Field(default_factory=UIState)
     projects: dict[str, Project] = Field(default_factory=dict)
     tasks: dict[str, Task] = Field(default_factory=dict)
-    backups: list[BackupInfo] = Field(default_factory=list)
 
 
 class SaveResponse(BaseModel):
@@ -3,29 +3,213 @@ State manager for JSON file persistence and backup snapshots.
 Implements "Last write wins" conflict resolution.
 """
 
-import json
+import atexit
+import gzip
+import hashlib
+import mmap
 import os
-import shutil
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from .schemas import AppState, BackupInfo, SCHEMA_VERSION
+import orjson
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+from .schemas import AppSettings, AppState, BackupInfo, Project, Task, UIState, SCHEMA_VERSION
+
+
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+BACKUP_COMPRESS_LEVEL = 1
+# Every Nth backup is a full snapshot; the ones in between are deltas.
+FULL_BACKUP_INTERVAL = 20
+ENTITY_MODELS = {"projects": Project, "tasks": Task}
+# Top-level sections light enough to build whole when streaming a backup.
+SMALL_SECTIONS = {"schema_version", "app", "ui_state"}
+# Saves arriving within this window are coalesced into a single disk write.
+FLUSH_DEBOUNCE_SECONDS = 0.25
+# Failed flushes are retried with exponential backoff, capped at this delay.
+FLUSH_RETRY_MAX_SECONDS = 10.0
+URING_QUEUE_ENTRIES = 16
 
 
 class StateManager:
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", use_io_uring: bool = True):
         self.data_dir = Path(data_dir)
         self.state_file = self.data_dir / "state.json"
         self.backups_dir = self.data_dir / "backups"
+        self.backups_index_file = self.data_dir / "backups_index.jsonl"
+        self.lock_file = self.data_dir / ".state.lock"
+
+        # In-memory copy of the last loaded/saved state, keyed by the state
+        # file's identity so writes by other processes are picked up. Each
+        # atomic replace gives state.json a new inode, even when the mtime
+        # doesn't change at the filesystem's timestamp granularity.
+        self._cache: Optional[AppState] = None
+        self._cache_key: Optional[tuple[int, int, int]] = None
+        self._cached_json: Optional[bytes] = None
+
+        # Backups are kept out of state.json in an append-only JSON Lines
+        # index, so adding one never rewrites the existing entries.
+        self._backups_index: list[BackupInfo] = []
+        self._backups_by_id: dict[str, BackupInfo] = {}
+        self._backups_index_offset = 0
+
+        # Per-entity content hashes of the last backup written by this
+        # process, used to write the next backup as a delta against it.
+        self._last_backup_id: Optional[str] = None
+        self._last_backup_hashes: dict[str, dict[str, str]] = {}
+        self._deltas_since_full = 0
+        self._last_backup_ns = 0
+
+        # Saves only update the in-memory state; a background thread
+        # writes the latest state (and its pending backup) to disk.
+        self._dirty = False
+        self._pending_backup: Optional[tuple[BackupInfo, Path]] = None
+        self._flush_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        self._lock = threading.RLock()
+        self._ring = self._init_uring() if use_io_uring else None
 
         self._ensure_directories()
+        self._load_backups_index()
+        atexit.register(self.flush)
+
+    def _init_uring(self):
+        """
+        Set up an io_uring instance for batched file writes.
+        Returns None, selecting plain synchronous writes, when liburing
+        isn't installed or the kernel doesn't allow io_uring.
+        """
+        if liburing is None:
+            return None
+        ring = liburing.Ring()
+        try:
+            liburing.io_uring_queue_init(URING_QUEUE_ENTRIES, ring)
+        except OSError as e:
+            print(f"io_uring unavailable, using synchronous writes: {e}")
+            return None
+        return ring
 
     def _ensure_directories(self) -> None:
         """Ensure data and backup directories exist."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.backups_dir.mkdir(parents=True, exist_ok=True)
 
+    def _load_backups_index(self) -> None:
+        """
+        Load the backups index into memory.
+        If there is no index yet, migrate the backups list embedded in a
+        legacy state.json into a new index file.
+        """
+        with self._file_lock():
+            if self.backups_index_file.exists():
+                self._refresh_backups_index()
+                return
+
+            if not self.state_file.exists():
+                return
+
+            try:
+                legacy_backups = [
+                    BackupInfo.model_validate(item)
+                    for item in self._read_json_mapped(self.state_file).get("backups", [])
+                ]
+            except Exception as e:
+                print(f"Error migrating backups from state file: {e}")
+                return
+
+            for backup_info in legacy_backups:
+                self._record_backup(backup_info)
+            payload = b"".join(self._serialize_backup_info(b) for b in self._backups_index)
+            self._write_file(self.backups_index_file, payload)
+            self._backups_index_offset = len(payload)
+
+    def _refresh_backups_index(self) -> None:
+        """
+        Read index entries appended since the last read, e.g. by another
+        worker process sharing the data directory.
+        """
+        try:
+            size = self.backups_index_file.stat().st_size
+        except FileNotFoundError:
+            return
+        if size <= self._backups_index_offset:
+            return
+
+        with open(self.backups_index_file, "rb") as f:
+            f.seek(self._backups_index_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self._backups_index_offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    backup_info = BackupInfo.model_validate(orjson.loads(line))
+                except Exception as e:
+                    print(f"Error loading backups index entry: {e}")
+                    continue
+                self._record_backup(backup_info)
+
+    @contextmanager
+    def _file_lock(self):
+        """
+        Hold an exclusive lock on the data directory across processes,
+        so multiple uvicorn workers never interleave their writes.
+        A no-op where fcntl is unavailable.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.lock_file, "ab") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _record_backup(self, backup_info: BackupInfo) -> None:
+        """Add a backup to the in-memory index, ignoring already known IDs."""
+        if backup_info.id in self._backups_by_id:
+            return
+        self._backups_index.append(backup_info)
+        self._backups_by_id[backup_info.id] = backup_info
+
+    def _serialize_backup_info(self, backup_info: BackupInfo) -> bytes:
+        """Serialize a backup index entry to one JSON line."""
+        return backup_info.model_dump_json().encode("utf-8") + b"\n"
+
+    def _append_backup_index(self, backup_info: BackupInfo) -> None:
+        """
+        Append a backup entry to the index file.
+        The caller must hold the file lock.
+        """
+        self._refresh_backups_index()
+        with open(self.backups_index_file, "ab") as f:
+            f.write(self._serialize_backup_info(backup_info))
+            f.flush()
+            os.fsync(f.fileno())
+            self._backups_index_offset = f.tell()
+
     def _get_default_state(self) -> AppState:
         """Return a new default state."""
         return AppState(schema_version=SCHEMA_VERSION)
@@ -33,22 +217,71 @@ class StateManager:
     def load_state(self) -> AppState:
         """
         Load state from JSON file.
+        Returns the cached state if the file hasn't changed since it was
+        last loaded or saved, or if a save is still waiting to be flushed.
         Returns default state if file doesn't exist.
+        The returned state is shared; callers must not mutate it.
+        """
+        with self._lock:
+            if self._dirty:
+                return self._cache
+
+            try:
+                key = self._state_file_key()
+            except FileNotFoundError:
+                self._cache = None
+                return self._get_default_state()
+
+            if self._cache is not None and key == self._cache_key:
+                return self._cache
+
+            try:
+                state = AppState.model_validate(self._read_json_mapped(self.state_file))
+            except (orjson.JSONDecodeError, Exception) as e:
+                print(f"Error loading state file: {e}")
+                self._cache = None
+                return self._get_default_state()
+
+            self._cache = state
+            self._cache_key = key
+            self._cached_json = None
+            return state
+
+    def _state_file_key(self) -> tuple[int, int, int]:
+        """Return the (inode, size, mtime) identity of state.json."""
+        st = self.state_file.stat()
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _read_json_mapped(self, path: Path):
+        """
+        Parse a JSON file straight from a read-only memory map,
+        without first copying its contents into a bytes object.
         """
-        if not self.state_file.exists():
-            return self._get_default_state()
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
 
-        try:
-            with open(self.state_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return AppState.model_validate(data)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Error loading state file: {e}")
-            return self._get_default_state()
+    def cached_json(self) -> bytes:
+        """
+        Return the current state serialized to JSON bytes.
+        Reuses the bytes written by the last save when still current.
+        """
+        with self._lock:
+            state = self.load_state()
+            if state is not self._cache:
+                return self._serialize(state)
+            if self._cached_json is None:
+                self._cached_json = self._serialize(state)
+            return self._cached_json
 
     def save_state(self, state: AppState, create_backup: bool = True) -> tuple[str, Optional[str]]:
         """
-        Save state to JSON file and optionally create a backup.
+        Save state and optionally create a backup.
+        The state is updated in memory immediately and written to disk by
+        the background flusher, so a burst of saves results in one write.
+        Saves made while a backup is still pending share that backup.
 
         Args:
             state: The application state to save
@@ -57,61 +290,278 @@ class StateManager:
         Returns:
             Tuple of (saved_at_iso, backup_id or None)
         """
-        now = datetime.now()
-        saved_at_iso = now.isoformat()
-        backup_id = None
-
-        existing_state = self.load_state()
-        state.backups = existing_state.backups.copy()
-
-        if create_backup:
-            backup_id = self._create_backup(state, now)
-
-        state_dict = state.model_dump(mode="json")
-
-        with open(self.state_file, "w", encoding="utf-8") as f:
-            json.dump(state_dict, f, ensure_ascii=False, indent=2)
-
-        return saved_at_iso, backup_id
+        with self._lock:
+            now = datetime.now()
+            saved_at_iso = now.isoformat()
+            backup_id = None
+
+            if create_backup:
+                if self._pending_backup is None:
+                    self._pending_backup = self._create_backup(now, self._delta_base_id())
+                    self._record_backup(self._pending_backup[0])
+                backup_id = self._pending_backup[0].id
+
+            self._cache = state
+            self._cached_json = None
+            self._dirty = True
+            self._schedule_flush()
+
+            return saved_at_iso, backup_id
+
+    def _schedule_flush(self) -> None:
+        """Wake the background flusher, starting it on first use."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="state-flusher", daemon=True
+            )
+            self._flusher.start()
+        self._flush_event.set()
+
+    def _flush_loop(self) -> None:
+        """
+        Write pending saves to disk, at most once per debounce interval.
+        A failed flush is retried with backoff until it succeeds.
+        """
+        retry_delay = FLUSH_DEBOUNCE_SECONDS
+        while True:
+            self._flush_event.wait()
+            time.sleep(FLUSH_DEBOUNCE_SECONDS)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error flushing state file, retrying in {retry_delay:g}s: {e}")
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, FLUSH_RETRY_MAX_SECONDS)
+                self._flush_event.set()
+            else:
+                retry_delay = FLUSH_DEBOUNCE_SECONDS
+
+    def flush(self) -> None:
+        """Write the in-memory state and its pending backup to disk, if dirty."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            state = self._cache
+            payload = self._serialize(state)
+            backup_payload = None
+            if self._pending_backup is not None:
+                backup_info, backup_path = self._pending_backup
+                hashes = self._entity_hashes(state)
+                base_id = backup_info.base_backup_id
+                if base_id is None:
+                    backup_payload = payload
+                else:
+                    backup_payload = self._serialize_delta(state, hashes, base_id)
+
+            files = [(self.state_file, payload)]
+            if backup_payload is not None:
+                files.append((backup_path, self._compress_backup(backup_payload)))
+
+            with self._file_lock():
+                self._write_files(files)
+                if backup_payload is not None:
+                    self._append_backup_index(backup_info)
+                self._cache_key = self._state_file_key()
+
+            if backup_payload is not None:
+                if base_id is None:
+                    self._deltas_since_full = 0
+                else:
+                    self._deltas_since_full += 1
+                self._last_backup_id = backup_info.id
+                self._last_backup_hashes = hashes
+                self._pending_backup = None
+
+            self._cached_json = payload
+            self._dirty = False
+
+    def _serialize(self, state: AppState) -> bytes:
+        """
+        Serialize state to JSON bytes.
+        Uses pydantic's native serializer rather than building a dict first.
+        """
+        return state.model_dump_json().encode("utf-8")
+
+    def _entity_hashes(self, state: AppState) -> dict[str, dict[str, str]]:
+        """Hash each project and task so changed entities can be detected."""
+        return {
+            key: {
+                entity_id: hashlib.sha256(entity.model_dump_json().encode("utf-8")).hexdigest()
+                for entity_id, entity in getattr(state, key).items()
+            }
+            for key in ENTITY_MODELS
+        }
+
+    def _delta_base_id(self) -> Optional[str]:
+        """
+        Return the backup the next backup should be a delta against,
+        or None if it should be a full snapshot.
+        """
+        if self._last_backup_id not in self._backups_by_id:
+            return None
+        if self._deltas_since_full >= FULL_BACKUP_INTERVAL - 1:
+            return None
+        return self._last_backup_id
+
+    def _serialize_delta(
+        self, state: AppState, hashes: dict[str, dict[str, str]], base_id: str
+    ) -> bytes:
+        """
+        Serialize only the projects and tasks that changed since the base
+        backup, plus the small top-level sections, to JSON bytes.
+        """
+        delta = {
+            "base": base_id,
+            "schema_version": state.schema_version,
+            "app": state.app.model_dump(mode="json"),
+            "ui_state": state.ui_state.model_dump(mode="json"),
+            "deleted": {},
+        }
+        for key in ENTITY_MODELS:
+            previous = self._last_backup_hashes.get(key, {})
+            entities = getattr(state, key)
+            delta[key] = {
+                entity_id: entities[entity_id].model_dump(mode="json")
+                for entity_id, digest in hashes[key].items()
+                if previous.get(entity_id) != digest
+            }
+            delta["deleted"][key] = [
+                entity_id for entity_id in previous if entity_id not in hashes[key]
+            ]
+        return orjson.dumps(delta, option=JSON_OPTIONS)
+
+    def _write_file(self, path: Path, payload: bytes) -> None:
+        """
+        Atomically write serialized state bytes to a file.
+        Writes to a temp file and renames it over the target, so readers
+        never see a partially written file.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+            if self._drops_page_cache(path):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        os.replace(tmp_path, path)
+
+    def _drops_page_cache(self, path: Path) -> bool:
+        """
+        Whether to evict a file's pages from the page cache once written.
+        Backups are written once and only read back on restore, so caching
+        them only pushes hot state.json pages out.
+        """
+        return hasattr(os, "posix_fadvise") and path.parent == self.backups_dir
 
-    def _create_backup(self, state: AppState, timestamp: datetime) -> str:
+    def _write_files(self, files: list[tuple[Path, bytes]]) -> None:
+        """
+        Atomically write several files, in order.
+        With io_uring, every write, fsync and rename is submitted as one
+        linked batch instead of one syscall each.
         """
-        Create a backup snapshot of the state.
+        if self._ring is None:
+            for path, payload in files:
+                self._write_file(path, payload)
+            return
+
+        # Each op is (prep function, prep args, expected result). The chain
+        # is linked, so a failed op cancels everything after it, renames
+        # included, and no target is replaced by a partial file.
+        fds = []
+        ops = []
+        try:
+            for path, payload in files:
+                tmp_path = path.with_name(path.name + ".tmp")
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                fds.append(fd)
+                ops.append((liburing.io_uring_prep_write, (fd, payload, 0), len(payload)))
+                ops.append((liburing.io_uring_prep_fsync, (fd,), 0))
+                if self._drops_page_cache(path):
+                    ops.append((liburing.io_uring_prep_fadvise, (fd, 0, os.POSIX_FADV_DONTNEED, 0), 0))
+            for path, _ in files:
+                tmp_path = path.with_name(path.name + ".tmp")
+                ops.append((liburing.io_uring_prep_rename, (str(tmp_path), str(path)), 0))
+            self._submit_uring_chain(ops)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _submit_uring_chain(self, ops: list) -> None:
+        """Submit linked io_uring ops, wait for all, and raise the first failure."""
+        for index, (prep, args, _) in enumerate(ops):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            if sqe is None:
+                raise OSError("io_uring submission queue is full")
+            prep(sqe, *args)
+            sqe.user_data = index
+            if index < len(ops) - 1:
+                sqe.flags |= liburing.IOSQE_IO_LINK
+
+        liburing.io_uring_submit_and_wait(self._ring, len(ops))
+
+        error = None
+        cqe = liburing.Cqe()
+        for _ in ops:
+            liburing.io_uring_wait_cqe(self._ring, cqe)
+            entry = cqe[0]
+            try:
+                # Reading res raises the errno of a failed op as OSError.
+                res = entry.res
+                expected = ops[entry.user_data][2]
+                if res != expected:
+                    raise OSError(f"io_uring short write: {res} of {expected} bytes")
+            except OSError as e:
+                error = error or e
+            finally:
+                liburing.io_uring_cqe_seen(self._ring, entry)
+
+        if error is not None:
+            raise error
+
+    def _compress_backup(self, payload: bytes) -> bytes:
+        """Gzip-compress serialized state bytes for a backup file."""
+        return gzip.compress(payload, compresslevel=BACKUP_COMPRESS_LEVEL)
+
+    def _create_backup(
+        self, timestamp: datetime, base_id: Optional[str] = None
+    ) -> tuple[BackupInfo, Path]:
+        """
+        Build the index entry and file path for a new backup snapshot.
+        The caller records the entry and writes the backup file.
 
         Args:
-            state: The state to backup
             timestamp: The timestamp for the backup
+            base_id: The backup this one is a delta against, or None for a full snapshot
 
         Returns:
-            The backup ID
+            Tuple of (backup_info, backup_path)
         """
-        ms = timestamp.strftime('%f')[:3]
-        backup_id = f"bkp_{timestamp.strftime('%Y%m%d_%H%M%S')}_{ms}"
-        backup_filename = f"state_{timestamp.strftime('%Y%m%d_%H%M%S')}_{ms}.json"
-        backup_path = self.backups_dir / backup_filename
-
-        state_dict = state.model_dump(mode="json")
+        # Nanosecond, strictly increasing ids: two backups in the same
+        # millisecond (or clock tick) never share a file.
+        ts_ns = max(time.time_ns(), self._last_backup_ns + 1)
+        self._last_backup_ns = ts_ns
+        backup_id = f"bkp_{ts_ns}"
+        suffix = ".json.gz" if base_id is None else ".delta.json.gz"
+        backup_path = self.backups_dir / f"state_{ts_ns}{suffix}"
 
         backup_info = BackupInfo(
             id=backup_id,
             created_at_iso=timestamp.isoformat(),
             reason="manual_save",
-            file_path=str(backup_path.relative_to(self.data_dir.parent))
+            file_path=str(backup_path.relative_to(self.data_dir.parent)),
+            compressed=True,
+            base_backup_id=base_id,
         )
 
-        if backup_info not in state.backups:
-            state.backups.append(backup_info)
-            state_dict = state.model_dump(mode="json")
-
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(state_dict, f, ensure_ascii=False, indent=2)
-
-        return backup_id
+        return backup_info, backup_path
 
     def get_backups(self) -> list[BackupInfo]:
         """Get list of all available backups."""
-        state = self.load_state()
-        return state.backups
+        with self._lock:
+            self._refresh_backups_index()
+            return list(self._backups_index)
 
     def restore_backup(self, backup_id: str) -> tuple[str, AppState]:
         """
@@ -127,40 +577,128 @@ class StateManager:
         Raises:
             ValueError: If backup not found
         """
-        current_state = self.load_state()
+        with self._lock:
+            self.flush()
+            self._refresh_backups_index()
+            current_state = self.load_state()
+            backup_info = self._backups_by_id.get(backup_id)
 
-        backup_info = None
-        for backup in current_state.backups:
-            if backup.id == backup_id:
-                backup_info = backup
-                break
+            if backup_info is None:
+                raise ValueError(f"Backup not found: {backup_id}")
 
-        if backup_info is None:
-            raise ValueError(f"Backup not found: {backup_id}")
+            chain = self._backup_chain(backup_info)
 
-        backup_path = self.data_dir.parent / backup_info.file_path
+            now = datetime.now()
+            safety_info, safety_path = self._create_backup(now)
+            with self._file_lock():
+                self._write_files([(safety_path, self._compress_backup(self._serialize(current_state)))])
+                self._record_backup(safety_info)
+                self._append_backup_index(safety_info)
 
-        if not backup_path.exists():
-            raise ValueError(f"Backup file not found: {backup_path}")
+            base_info, base_path = chain[0]
+            restored_state = self._load_backup_file(base_path, base_info.compressed)
+            for delta_info, delta_path in chain[1:]:
+                self._apply_delta_file(restored_state, delta_path, delta_info.compressed)
 
-        now = datetime.now()
-        self._create_backup(current_state, now)
+            self.save_state(restored_state, create_backup=False)
+            self.flush()
 
-        with open(backup_path, "r", encoding="utf-8") as f:
-            backup_data = json.load(f)
+            return now.isoformat(), restored_state
 
-        restored_state = AppState.model_validate(backup_data)
+    def _backup_chain(self, backup_info: BackupInfo) -> list[tuple[BackupInfo, Path]]:
+        """
+        Resolve a backup to its index entries and file paths, from the full
+        snapshot it is based on through each delta up to the backup itself.
 
-        restored_state.backups = current_state.backups
+        Raises:
+            ValueError: If a backup in the chain or its file is missing
+        """
+        chain = []
+        info: Optional[BackupInfo] = backup_info
+        while True:
+            backup_path = self.data_dir.parent / info.file_path
+            if not backup_path.exists():
+                raise ValueError(f"Backup file not found: {backup_path}")
+            chain.append((info, backup_path))
+
+            if info.base_backup_id is None:
+                break
+            base_id = info.base_backup_id
+            info = self._backups_by_id.get(base_id)
+            if info is None:
+                raise ValueError(f"Base backup not found: {base_id}")
+
+        chain.reverse()
+        return chain
+
+    def _apply_delta_file(self, state: AppState, delta_path: Path, compressed: bool) -> None:
+        """Apply a delta backup file on top of a restored state in place."""
+        opener = gzip.open if compressed else open
+        with opener(delta_path, "rb") as f:
+            delta = orjson.loads(f.read())
+
+        state.schema_version = delta["schema_version"]
+        state.app = AppSettings.model_validate(delta["app"])
+        state.ui_state = UIState.model_validate(delta["ui_state"])
+
+        for key, model in ENTITY_MODELS.items():
+            entities = getattr(state, key)
+            for entity_id in delta["deleted"][key]:
+                entities.pop(entity_id, None)
+            for entity_id, item in delta[key].items():
+                entities[entity_id] = model.model_validate(item)
+
+    def _load_backup_file(self, backup_path: Path, compressed: bool) -> AppState:
+        """
+        Load and validate a backup file.
+        When ijson is installed, projects and tasks are streamed and
+        validated one at a time, so the parsed dict and the validated
+        model are never both held in memory in full.
+        """
+        opener = gzip.open if compressed else open
+        with opener(backup_path, "rb") as f:
+            if ijson is None:
+                return AppState.model_validate(orjson.loads(f.read()))
 
-        self.save_state(restored_state, create_backup=False)
+            return self._stream_backup(f)
 
-        return now.isoformat(), restored_state
+    def _stream_backup(self, f) -> AppState:
+        """
+        Build an AppState from a backup with ijson.
+        The small top-level sections are read in one pass that stops as
+        soon as they are all found (they precede projects and tasks in the
+        serialized state). Projects and tasks are then streamed with
+        ijson's native kvitems and validated one entity at a time.
+        """
+        sections = {}
+        builder = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                if prefix == "" and event == "map_key" and value not in ENTITY_MODELS:
+                    key = value
+                    builder = ijson.ObjectBuilder()
+                continue
+
+            builder.event(event, value)
+            if prefix == key and event not in ("map_key", "start_map", "start_array"):
+                sections[key] = builder.value
+                builder = None
+                if SMALL_SECTIONS.issubset(sections):
+                    break
+
+        state = AppState.model_validate(sections)
+        for key, model in ENTITY_MODELS.items():
+            f.seek(0)
+            entities = getattr(state, key)
+            for entity_id, item in ijson.kvitems(f, key, use_float=True):
+                entities[entity_id] = model.model_validate(item)
+        return state
 
     def backup_exists(self, backup_id: str) -> bool:
         """Check if a backup with the given ID exists."""
-        backups = self.get_backups()
-        return any(b.id == backup_id for b in backups)
+        with self._lock:
+            self._refresh_backups_index()
+            return backup_id in self._backups_by_id
 
 
 state_manager = StateManager(data_dir="data")
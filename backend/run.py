@@ -1,5 +1,19 @@
 """Entry point to run the FastAPI server."""
+import os
+import sys
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8001, reload=True)
+    # Multiple workers share the data directory through a file lock; the
+    # auto-reloader only supports a single worker, so it is dev-only.
+    workers = int(os.environ.get("WORKERS", "1"))
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8001,
+        reload=workers == 1,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
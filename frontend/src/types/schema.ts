@@ -90,6 +90,8 @@ export interface BackupInfo {
   created_at_iso: string;
   reason: string;
   file_path: string;
+  compressed?: boolean;
+  base_backup_id?: string | null;
 }
 
 export interface AppState {
@@ -98,7 +100,6 @@ export interface AppState {
   ui_state: UIState;
   projects: Record<string, Project>;
   tasks: Record<string, Task>;
-  backups: BackupInfo[];
 }
 
 export interface SaveResponse {
@@ -136,6 +137,5 @@ export function createDefaultState(): AppState {
     },
     projects: {},
     tasks: {},
-    backups: [],
   };
 }